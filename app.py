@@ -1,9 +1,22 @@
+import asyncio
 import os
+import re
+import time
+import aiohttp
+import orjson
 import streamlit as st
 import pandas as pd
 import requests
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from dateutil import tz as dateutil_tz
+from functools import lru_cache
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import cache
 
 # --- Configuration & Constants ---
 ESPN_BASE = "https://site.api.espn.com/apis/site/v2/sports"
@@ -61,10 +74,12 @@ TRACKING_CONFIG = {
 }
 
 GRAND_SLAM_KEYS = ["australian open", "french open", "roland garros", "wimbledon", "us open"]
+_SLAM_RE = re.compile("|".join(map(re.escape, GRAND_SLAM_KEYS)), re.IGNORECASE)
 
 # --- Custom CSS for Styling & Animations ---
-def inject_custom_css():
-    st.markdown("""
+
+# Kept at module scope so the blob is built once at import, not per rerun.
+_CSS_BLOB = """
     <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;600;800&family=Montserrat:wght@700;900&display=swap');
 
@@ -181,157 +196,421 @@ def inject_custom_css():
         background: #484F58;
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def inject_custom_css():
+    # Re-injected every run: Streamlit drops prior elements on rerun, so a
+    # session-state guard here would lose the stylesheet after the first pass.
+    st.markdown(_CSS_BLOB, unsafe_allow_html=True)
 
 # --- Data Fetching Logic (Cached) ---
 
-@st.cache_data(ttl=120)
-def fetch_json(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+@st.cache_resource
+def get_http_session() -> requests.Session:
+    """Shared session so keep-alive sockets to ESPN / The Odds API are reused
+    instead of paying a fresh TCP+TLS handshake per call.
+
+    cache_resource (rather than a module global) keeps one pool alive across
+    reruns, sessions, and script reloads. Don't mutate the returned session;
+    pass per-call state to .get() instead.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+    ))
+    return session
+
+@lru_cache(maxsize=1)
+def _odds_api_key() -> Optional[str]:
+    try:
+        key = st.secrets.get("ODDS_API_KEY")
+    except Exception:
+        key = None
+    return key or os.getenv("ODDS_API_KEY")
+
+def _prefetch_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    if not params:
+        return url
+    return url + "?" + urlencode(sorted(params.items()))
+
+# Per-endpoint TTLs for the persistent file cache (seconds). Team metadata
+# barely changes; odds go stale quickly.
+_FILE_CACHE_TTLS = (
+    ("/teams", 7 * 86400),
+    ("/news", 600),
+    ("/scoreboard", 180),
+    ("/odds", 120),
+)
+_FILE_CACHE_DEFAULT_TTL = 180
+
+def _file_cache_ttl(url: str) -> float:
+    for suffix, ttl in _FILE_CACHE_TTLS:
+        if suffix in url:
+            return ttl
+    return _FILE_CACHE_DEFAULT_TTL
+
+def _http_get_json(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    key = _prefetch_key(url, params)
+    entry = cache.get_entry(key)
+    if entry is not None and time.time() - entry.get("ts", 0) <= _file_cache_ttl(url):
+        return entry.get("data")
+
+    # Stale entry: replay its validators so an unchanged response comes back
+    # as a body-less 304 instead of a full payload.
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
     try:
-        res = requests.get(url, params=params, timeout=15)
+        res = get_http_session().get(url, params=params, timeout=15, headers=headers or None)
+        if res.status_code == 304 and entry is not None:
+            cache.touch(key)
+            return entry.get("data")
         res.raise_for_status()
-        return res.json()
-    except requests.RequestException:
+        # orjson decodes the raw bytes directly, skipping res.json()'s
+        # charset sniffing and the slower stdlib parser.
+        data = orjson.loads(res.content)
+    except (requests.RequestException, orjson.JSONDecodeError):
         return {}
+    cache.set(key, data, etag=res.headers.get("ETag"), last_modified=res.headers.get("Last-Modified"))
+    return data
 
-@st.cache_data(ttl=3600)
-def get_team_id(sport: str, league: str, team_name: str) -> Optional[str]:
+def _enumerate_prefetch_targets(cfgs) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    now = datetime.now(timezone.utc)
+    start, end = now - timedelta(days=7), now + timedelta(days=14)
+    date_range = f"{start.strftime('%Y%m%d')}-{end.strftime('%Y%m%d')}"
+    api_key = _odds_api_key()
+
+    targets: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+    seen = set()
+
+    def add(url: str, params: Optional[Dict[str, Any]] = None):
+        key = _prefetch_key(url, params)
+        if key not in seen:
+            seen.add(key)
+            targets.append((url, params))
+
+    for cfg in cfgs:
+        add(f"{ESPN_BASE}/{cfg['sport']}/{cfg['league']}/scoreboard", {"dates": date_range, "limit": 200})
+        if cfg["team_name"]:
+            add(f"{ESPN_BASE}/{cfg['sport']}/{cfg['league']}/teams")
+        add(f"{ESPN_BASE}/{cfg['sport']}/{cfg['league']}/news")
+        if api_key and cfg["odds_sport_key"]:
+            odds_url = f"{ODDS_BASE}/sports/{cfg['odds_sport_key']}/odds"
+            add(odds_url, {"apiKey": api_key, "regions": "us", "markets": "h2h,spreads,totals,outrights", "oddsFormat": "american"})
+    add(f"{ESPN_BASE}/racing/f1/standings")
+    return targets
+
+async def _afetch_json(session: aiohttp.ClientSession, url: str,
+                       params: Optional[Dict[str, Any]]) -> None:
+    """Async twin of _http_get_json: same file cache, same conditional GETs.
+
+    Only warms the file cache — failures write nothing, so a flaky fetch
+    never pins a bad entry; the sync path simply retries on demand.
+    """
+    key = _prefetch_key(url, params)
+    entry = cache.get_entry(key)
+    if entry is not None and time.time() - entry.get("ts", 0) <= _file_cache_ttl(url):
+        return
+
+    headers = {}
+    if entry is not None:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    query = {k: str(v) for k, v in params.items()} if params else None
+    try:
+        async with session.get(url, params=query, headers=headers or None) as res:
+            if res.status == 304 and entry is not None:
+                cache.touch(key)
+                return
+            res.raise_for_status()
+            body = await res.read()
+            etag = res.headers.get("ETag")
+            last_modified = res.headers.get("Last-Modified")
+        data = orjson.loads(body)
+    except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError):
+        return
+    cache.set(key, data, etag=etag, last_modified=last_modified)
+
+async def _prefetch_async(targets: List[Tuple[str, Optional[Dict[str, Any]]]]) -> None:
+    timeout = aiohttp.ClientTimeout(total=15)
+    connector = aiohttp.TCPConnector(limit=32)
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        await asyncio.gather(
+            *(_afetch_json(session, url, params) for url, params in targets),
+            return_exceptions=True)
+
+def prefetch_all(cfgs: Dict[str, Dict[str, Any]]) -> None:
+    """Fetch every URL the tabs will need concurrently, so the six
+    independent API chains overlap instead of serializing.
+
+    Runs once per session to warm the persistent file cache; after that
+    the normal fetch path refreshes data as TTLs expire. When the active
+    tab is named via ?tab=<key>, its URLs are queued first so they win
+    any connection-slot contention.
+    """
+    if st.session_state.get("_prefetch_done"):
+        return
+    try:
+        active_key = st.query_params.get("tab")
+    except Exception:
+        active_key = None
+    ordered = sorted(cfgs.items(), key=lambda kv: kv[0] != active_key)
+    targets = _enumerate_prefetch_targets([cfg for _, cfg in ordered])
+    asyncio.run(_prefetch_async(targets))
+    st.session_state["_prefetch_done"] = True
+
+def fetch_json(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    # Sorted tuple-of-items hashes in C and is insertion-order invariant,
+    # unlike the dict the cache hasher would otherwise walk.
+    return _fetch_json_cached(url, tuple(sorted((params or {}).items())))
+
+@st.cache_data(ttl=120, max_entries=256)
+def _fetch_json_cached(url: str, params_items: Tuple[Tuple[str, Any], ...]) -> Dict[str, Any]:
+    params = dict(params_items) if params_items else None
+    return _http_get_json(url, params)
+
+@st.cache_data(ttl=86400, persist="disk", max_entries=16)
+def build_team_name_index(sport: str, league: str) -> Dict[str, str]:
+    """One {normalized alias: team id} index per league, built from a single
+    /teams fetch and shared by every lookup against that league."""
     url = f"{ESPN_BASE}/{sport}/{league}/teams"
     data = fetch_json(url)
     candidates = data.get("sports", [{}])[0].get("leagues", [{}])[0].get("teams", [])
-    target = team_name.lower()
+    index: Dict[str, str] = {}
     for item in candidates:
         team = item.get("team", {})
-        names = [team.get("displayName", ""), team.get("name", ""), team.get("shortDisplayName", ""), team.get("abbreviation", "")]
-        joined = " ".join(names).lower()
-        if target in joined or joined in target:
-            return team.get("id")
+        for alias in (team.get("displayName"), team.get("name"), team.get("shortDisplayName"), team.get("abbreviation")):
+            if alias:
+                index.setdefault(_normalize_team_name(alias), team.get("id"))
+    return index
+
+@st.cache_data(ttl=86400, persist="disk", max_entries=64)
+def get_team_id(sport: str, league: str, team_name: str) -> Optional[str]:
+    index = build_team_name_index(sport, league)
+    target = _normalize_team_name(team_name)
+    team_id = index.get(target)
+    if team_id is not None:
+        return team_id
+    # Fallback for partial names that don't match an alias exactly.
+    for norm, tid in index.items():
+        if target in norm or norm in target:
+            return tid
     return None
 
-@st.cache_data(ttl=180)
-def get_events_in_window(sport: str, league: str, start: datetime, end: datetime) -> List[Dict[str, Any]]:
+@dataclass(slots=True)
+class EventRow:
+    """The slice of a scoreboard event the renderers actually read.
+
+    Full events carry venue/broadcast/odds/leaders blobs that inflate the
+    cached payload 5-10x over what we display; projecting down to this
+    shrinks cache RAM and the pickling cost of @st.cache_data, and turns
+    downstream chained .get() walks into attribute reads.
+    """
+    id: Optional[str]
+    iso_date: Optional[str]
+    away: str
+    home: str
+    away_score: str
+    home_score: str
+    status: str
+    name: str
+    short_name: str
+    # Normalized names of *every* competitor — F1 events carry a whole grid,
+    # so the team filter can't look at just the away/home pair.
+    competitor_names: Tuple[str, ...] = ()
+
+def _project_event(event: Dict[str, Any]) -> EventRow:
+    competition = event.get("competitions", [{}])[0]
+    competitors = competition.get("competitors", [])
+    away = home = away_score = home_score = ""
+    if len(competitors) >= 2:
+        away_obj, home_obj = _split_competitors(competitors)
+        away = away_obj.get("team", {}).get("displayName", "")
+        home = home_obj.get("team", {}).get("displayName", "")
+        away_score = away_obj.get("score", "") or ""
+        home_score = home_obj.get("score", "") or ""
+    elif competitors:
+        away = competitors[0].get("team", {}).get("displayName", "")
+    status = competition.get("status", {}).get("type", {}).get("description") or event.get("status", {}).get("type", {}).get("description", "")
+    competitor_names = tuple(
+        norm for norm in
+        (_normalize_team_name(c.get("team", {}).get("displayName", "")) for c in competitors)
+        if norm)
+    return EventRow(
+        id=event.get("id"),
+        iso_date=event.get("date"),
+        away=away,
+        home=home,
+        away_score=away_score,
+        home_score=home_score,
+        status=status,
+        name=event.get("name") or "",
+        short_name=event.get("shortName") or "",
+        competitor_names=competitor_names,
+    )
+
+@st.cache_data(ttl=180, max_entries=32)
+def get_events_in_window(sport: str, league: str, start: date, end: date) -> List[EventRow]:
     date_range = f"{start.strftime('%Y%m%d')}-{end.strftime('%Y%m%d')}"
     url = f"{ESPN_BASE}/{sport}/{league}/scoreboard"
     data = fetch_json(url, params={"dates": date_range, "limit": 200})
-    return data.get("events", [])
+    return [_project_event(e) for e in data.get("events", [])]
+
+@st.cache_data(ttl=180, max_entries=32)
+def _index_events_by_team(sport: str, league: str, start: date, end: date) -> Dict[str, List[EventRow]]:
+    """Index a league's scoreboard by normalized competitor name, built once
+    per window so tabs sharing a league (Lakers/Knicks) don't each re-scan it."""
+    index: Dict[str, List[EventRow]] = {}
+    for e in get_events_in_window(sport, league, start, end):
+        for norm in e.competitor_names:
+            index.setdefault(norm, []).append(e)
+    return index
 
 # --- Utility Functions ---
 
-def _normalize_team_name(name: str) -> str:
-    cleaned = "".join(ch for ch in (name or "").lower() if ch.isalnum() or ch.isspace())
+# Deletes punctuation in one C-level pass; alphanumerics and whitespace pass through.
+_NORM_TABLE = str.maketrans({c: None for c in map(chr, range(256)) if not (c.isalnum() or c.isspace())})
+
+@lru_cache(maxsize=4096)
+def _normalize_team_name(name: Optional[str]) -> str:
+    cleaned = (name or "").lower().translate(_NORM_TABLE)
     return " ".join(cleaned.split())
 
+def _split_competitors(competitors: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Split competitors into (away, home) in a single pass.
+
+    Callers guarantee at least two entries; positional order is the
+    fallback when homeAway flags are missing, matching the old double
+    next() scans.
+    """
+    away_obj = home_obj = None
+    for c in competitors:
+        ha = c.get("homeAway")
+        if ha == "away":
+            if away_obj is None: away_obj = c
+        elif ha == "home":
+            if home_obj is None: home_obj = c
+    if away_obj is None: away_obj = competitors[0]
+    if home_obj is None: home_obj = competitors[1]
+    return away_obj, home_obj
+
+@lru_cache(maxsize=4096)
 def _make_matchup_key(away: str, home: str, iso_datetime: Optional[str]) -> str:
-    try:
-        dt = datetime.fromisoformat(iso_datetime.replace("Z", "+00:00")) if iso_datetime else None
-        date_key = dt.date().isoformat() if dt else ""
-    except Exception:
-        date_key = ""
+    # Both ESPN and the Odds API emit ISO-8601 UTC timestamps date-first, so
+    # the date component is a plain slice — no fromisoformat round trip.
+    date_key = iso_datetime[:10] if iso_datetime else ""
     return f"{_normalize_team_name(away)}|{_normalize_team_name(home)}|{date_key}"
 
-def build_matchup_key_from_espn_event(event: Dict[str, Any]) -> str:
-    competition = event.get("competitions", [{}])[0]
-    competitors = competition.get("competitors", [])
-    if len(competitors) >= 2:
-        away_obj = next((c for c in competitors if c.get("homeAway") == "away"), competitors[0])
-        home_obj = next((c for c in competitors if c.get("homeAway") == "home"), competitors[1])
-        away = away_obj.get("team", {}).get("displayName", "")
-        home = home_obj.get("team", {}).get("displayName", "")
-    else:
-        away = competitors[0].get("team", {}).get("displayName", "") if competitors else ""
-        home = ""
-    iso_date = event.get("date")
-    return _make_matchup_key(away, home, iso_date)
+def build_matchup_key_from_espn_event(event: EventRow) -> str:
+    return _make_matchup_key(event.away, event.home, event.iso_date)
+
+def _scan_h2h(outcomes: List[Dict[str, Any]], home: str, away: str, found: Dict[str, Any]) -> None:
+    slots = {home: "home_ml", away: "away_ml"}
+    for o in outcomes:
+        price = o.get("price")
+        if price is None: continue
+        slot = slots.get(o.get("name"))
+        if slot and slot not in found:
+            found[slot] = price
+
+def _scan_spreads(outcomes: List[Dict[str, Any]], home: str, away: str, found: Dict[str, Any]) -> None:
+    if "spread" in found: return
+    for o in outcomes:
+        if o.get("name") == home:
+            point, price = o.get("point"), o.get("price")
+            if price is not None:
+                found["spread"] = (point, price)
+                return
+
+def _scan_totals(outcomes: List[Dict[str, Any]], home: str, away: str, found: Dict[str, Any]) -> None:
+    if "total" in found: return
+    for o in outcomes:
+        name_lower = (o.get("name") or "").lower()
+        if name_lower[:4] == "over":
+            point, price = o.get("point"), o.get("price")
+            if price is not None:
+                found["total"] = (point, price)
+                return
+
+_MARKET_HANDLERS = {"h2h": _scan_h2h, "spreads": _scan_spreads, "totals": _scan_totals}
 
 def summarize_odds_for_event(odds_event: Dict[str, Any]) -> Dict[str, str]:
     home = odds_event.get("home_team", "")
     away = odds_event.get("away_team", "")
-    best_home_ml, best_away_ml, best_spread, best_total = None, None, None, None
+    found: Dict[str, Any] = {}
 
     for book in odds_event.get("bookmakers", []):
         for market in book.get("markets", []):
-            key, outcomes = market.get("key"), market.get("outcomes", [])
-            if key == "h2h":
-                for o in outcomes:
-                    name, price = o.get("name"), o.get("price")
-                    if price is None: continue
-                    if name == home: best_home_ml = price
-                    elif name == away: best_away_ml = price
-            elif key == "spreads":
-                for o in outcomes:
-                    if o.get("name") == home:
-                        point, price = o.get("point"), o.get("price")
-                        if price is not None: best_spread = (point, price)
-            elif key == "totals":
-                for o in outcomes:
-                    if str(o.get("name", "")).lower().startswith("over"):
-                        point, price = o.get("point"), o.get("price")
-                        if price is not None: best_total = (point, price)
+            handler = _MARKET_HANDLERS.get(market.get("key"))
+            if handler:
+                handler(market.get("outcomes", []), home, away, found)
+        # home_ml, away_ml, spread, total — nothing left to find.
+        if len(found) == 4:
+            break
 
     summary: Dict[str, str] = {}
-    if best_home_ml is not None and best_away_ml is not None:
-        summary["moneyline"] = f"{best_away_ml:+} / {best_home_ml:+}"
-    if best_spread is not None:
-        summary["spread"] = f"{best_spread[0]:+g} ({best_spread[1]:+})"
-    if best_total is not None:
-        summary["total"] = f"O/U {best_total[0]} ({best_total[1]:+})"
+    home_ml, away_ml = found.get("home_ml"), found.get("away_ml")
+    if home_ml is not None and away_ml is not None:
+        summary["moneyline"] = f"{away_ml:+} / {home_ml:+}"
+    spread = found.get("spread")
+    if spread is not None:
+        point, price = spread
+        # Exact type check beats isinstance here, and guards the :+g format.
+        point_type = type(point)
+        if point_type is float or point_type is int:
+            summary["spread"] = f"{point:+g} ({price:+})"
+    total = found.get("total")
+    if total is not None:
+        summary["total"] = f"O/U {total[0]} ({total[1]:+})"
     return summary
 
-@st.cache_data(ttl=120)
-def get_event_odds_map(odds_sport_key: str, api_key: str) -> Dict[str, Dict[str, str]]:
+@st.cache_data(ttl=120, max_entries=16)
+def get_odds_payload(odds_sport_key: str, api_key: str) -> List[Dict[str, Any]]:
+    """Fetch a sport's odds once, covering the per-game markets and the
+    outrights in the same request, so the schedule table and the market
+    outlook don't each burn an Odds API call."""
     url = f"{ODDS_BASE}/sports/{odds_sport_key}/odds"
-    params = {"apiKey": api_key, "regions": "us", "markets": "h2h,spreads,totals", "oddsFormat": "american"}
+    params = {"apiKey": api_key, "regions": "us", "markets": "h2h,spreads,totals,outrights", "oddsFormat": "american"}
     data = fetch_json(url, params=params)
-    if not isinstance(data, list): return {}
-    out: Dict[str, Dict[str, str]] = {}
+    return data if isinstance(data, list) else []
+
+def _iter_event_summaries(data: List[Dict[str, Any]]):
+    """Yield (matchup key, summary) in one pass over an odds payload."""
     for event in data:
-        key = _make_matchup_key(event.get("away_team", ""), event.get("home_team", ""), event.get("commence_time"))
+        home = event.get("home_team")
+        # Outright (futures) entries carry no matchup; the outlook renderer reads those.
+        if not home:
+            continue
         summary = summarize_odds_for_event(event)
-        if summary: out[key] = summary
-    return out
-
-def format_event_row(event: Dict[str, Any]) -> Dict[str, Any]:
-    competition = event.get("competitions", [{}])[0]
-    competitors = competition.get("competitors", [])
-    if len(competitors) < 2:
-        away = competitors[0].get("team", {}).get("displayName", "TBD") if competitors else "TBD"
-        home = "TBD"
-        score = "-"
-    else:
-        away_obj = next((c for c in competitors if c.get("homeAway") == "away"), competitors[0])
-        home_obj = next((c for c in competitors if c.get("homeAway") == "home"), competitors[1])
-        away = away_obj.get("team", {}).get("displayName", "Away")
-        home = home_obj.get("team", {}).get("displayName", "Home")
-        away_score = away_obj.get("score", "")
-        home_score = home_obj.get("score", "")
-        score = f"{away_score}-{home_score}" if away_score or home_score else "-"
-
-    iso_date = event.get("date")
-    dt_utc = datetime.fromisoformat(iso_date.replace("Z", "+00:00")) if iso_date else None
-    local_time = dt_utc.astimezone().strftime("%Y-%m-%d %I:%M %p") if dt_utc else "-"
-    status = competition.get("status", {}).get("type", {}).get("description") or event.get("status", {}).get("type", {}).get("description", "")
+        if summary:
+            yield _make_matchup_key(event.get("away_team", ""), home, event.get("commence_time")), summary
 
-    return {"Date/Time": local_time, "Matchup": f"{away} @ {home}", "Score": score, "Status": status}
+@st.cache_data(ttl=120, max_entries=16)
+def get_event_odds_map(odds_sport_key: str, api_key: str) -> Dict[str, Dict[str, str]]:
+    return dict(_iter_event_summaries(get_odds_payload(odds_sport_key, api_key)))
 
-def filter_team_events(events: List[Dict[str, Any]], team_name: Optional[str]) -> List[Dict[str, Any]]:
+def filter_team_events(events: List[EventRow], team_name: Optional[str]) -> List[EventRow]:
     if not team_name: return events
     filtered = []
-    target = team_name.lower()
+    target = _normalize_team_name(team_name)
     for e in events:
-        competitors = e.get("competitions", [{}])[0].get("competitors", [])
-        names = [c.get("team", {}).get("displayName", "").lower() for c in competitors]
-        if any(target in n or n in target for n in names):
+        if target in e.competitor_names:
+            filtered.append(e)
+        elif any(target in n or n in target for n in e.competitor_names):
             filtered.append(e)
     return filtered
 
-def filter_grand_slams(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    out = []
-    for e in events:
-        name = (e.get("name") or "").lower()
-        short_name = (e.get("shortName") or "").lower()
-        if any(k in name or k in short_name for k in GRAND_SLAM_KEYS):
-            out.append(e)
-    return out
+def filter_grand_slams(events: List[EventRow]) -> List[EventRow]:
+    return [e for e in events if _SLAM_RE.search(e.name) or _SLAM_RE.search(e.short_name)]
 
 # --- Rendering Components ---
 
@@ -339,44 +618,74 @@ def render_header():
     st.markdown('<div class="main-header">NeelSPN</div>', unsafe_allow_html=True)
     st.markdown('<p style="color: #8B949E; font-size: 1.1rem; margin-bottom: 2rem;">Personalized Sports Tracker Dashboard</p>', unsafe_allow_html=True)
 
+@st.fragment(run_every="180s")
 def render_scores_and_schedule(cfg: Dict[str, Any]):
     st.subheader("Recent Scores & Schedule")
     now = datetime.now(timezone.utc)
-    past_start, future_end = now - timedelta(days=7), now + timedelta(days=14)
-
-    events = get_events_in_window(cfg["sport"], cfg["league"], past_start, future_end)
-    if cfg["team_name"] is None and "mens_tennis_slams" in cfg["label"].lower():
-        events = filter_grand_slams(events)
-    events = filter_team_events(events, cfg["team_name"])
+    # date objects, not datetimes: the cache key must be day-granular or
+    # every tab/rerun would miss on microsecond-fresh timestamps.
+    past_start, future_end = (now - timedelta(days=7)).date(), (now + timedelta(days=14)).date()
+
+    if cfg["team_name"]:
+        index = _index_events_by_team(cfg["sport"], cfg["league"], past_start, future_end)
+        events = index.get(_normalize_team_name(cfg["team_name"]))
+        if events is None:
+            # Partial names (e.g. "Mercedes") fall back to the fuzzy filter.
+            events = filter_team_events(
+                get_events_in_window(cfg["sport"], cfg["league"], past_start, future_end),
+                cfg["team_name"])
+    else:
+        events = get_events_in_window(cfg["sport"], cfg["league"], past_start, future_end)
+        if "mens_tennis_slams" in cfg["label"].lower():
+            events = filter_grand_slams(events)
 
     if not events:
         st.info("No recent or upcoming events found.")
         return
 
-    api_key = st.secrets.get("ODDS_API_KEY") or os.getenv("ODDS_API_KEY")
+    api_key = _odds_api_key()
     odds_map = {}
     if api_key and cfg["odds_sport_key"]:
         odds_map = get_event_odds_map(cfg["odds_sport_key"], api_key)
 
-    rows = []
+    # Single pass over events collecting parallel column lists; dates are
+    # then parsed and formatted in one vectorized call instead of per row.
+    iso_dates: List[Optional[str]] = []
+    matchups: List[str] = []
+    scores: List[str] = []
+    statuses: List[str] = []
+    matchup_keys: List[str] = []
     for e in events:
-        row = format_event_row(e)
-        if cfg["odds_sport_key"]:
-            if api_key:
-                matchup_key = build_matchup_key_from_espn_event(e)
-                summary = odds_map.get(matchup_key) if odds_map else None
-                row["Moneyline"] = summary.get("moneyline", "hi cam") if summary else "hi cam"
-                row["Spread"] = summary.get("spread", "hi cam") if summary else "hi cam"
-                row["Total"] = summary.get("total", "hi cam") if summary else "hi cam"
-            else:
-                row["Moneyline"] = "hi cam"
-                row["Spread"] = "hi cam"
-                row["Total"] = "hi cam"
-        rows.append(row)
-
-    df = pd.DataFrame(rows)
+        iso_dates.append(e.iso_date)
+        matchups.append(f"{e.away or 'TBD'} @ {e.home or 'TBD'}")
+        scores.append(f"{e.away_score}-{e.home_score}" if e.away_score or e.home_score else "-")
+        statuses.append(e.status)
+        if odds_map:
+            matchup_keys.append(build_matchup_key_from_espn_event(e))
+
+    dt = pd.to_datetime(iso_dates, utc=True, format="ISO8601", errors="coerce")
+    # tzlocal() applies each timestamp's own DST rules; a fixed offset from
+    # datetime.now() would shift events on the far side of a transition.
+    local = dt.tz_convert(dateutil_tz.tzlocal())
+    date_col = pd.Series(local.strftime("%Y-%m-%d %I:%M %p")).fillna("-")
+
+    df = pd.DataFrame({"Date/Time": date_col, "Matchup": matchups, "Score": scores, "Status": statuses})
+    if cfg["odds_sport_key"]:
+        if odds_map:
+            key_series = pd.Series(matchup_keys)
+            ml_map = {k: v["moneyline"] for k, v in odds_map.items() if "moneyline" in v}
+            spread_map = {k: v["spread"] for k, v in odds_map.items() if "spread" in v}
+            total_map = {k: v["total"] for k, v in odds_map.items() if "total" in v}
+            df["Moneyline"] = key_series.map(ml_map).fillna("hi cam")
+            df["Spread"] = key_series.map(spread_map).fillna("hi cam")
+            df["Total"] = key_series.map(total_map).fillna("hi cam")
+        else:
+            df["Moneyline"] = "hi cam"
+            df["Spread"] = "hi cam"
+            df["Total"] = "hi cam"
     st.dataframe(df, use_container_width=True, hide_index=True)
 
+@st.fragment(run_every="180s")
 def render_news(cfg: Dict[str, Any]):
     st.subheader("Latest Headlines")
     team_id = get_team_id(cfg["sport"], cfg["league"], cfg["team_name"]) if cfg["team_name"] else None
@@ -411,13 +720,14 @@ def render_news(cfg: Dict[str, Any]):
         </div>
         """, unsafe_allow_html=True)
 
+@st.fragment(run_every="180s")
 def render_odds_summary(cfg: Dict[str, Any]):
     st.subheader("Market Outlook")
     if not cfg["odds_sport_key"]:
         st.info("hi cam")
         return
 
-    api_key = st.secrets.get("ODDS_API_KEY") or os.getenv("ODDS_API_KEY")
+    api_key = _odds_api_key()
     if not api_key:
         st.info("hi cam")
         return
@@ -442,28 +752,38 @@ def render_odds_summary(cfg: Dict[str, Any]):
             st.metric("Championship Odds", odds["championship_market"])
             st.markdown('</div>', unsafe_allow_html=True)
 
+_PLAYOFF_RE = re.compile(r"playoff|make playoffs")
+_TITLE_RE = re.compile(r"champion|title|\bwin\b")
+
+@st.cache_data(ttl=300, max_entries=32)
 def get_live_odds_internal(team_name: str, odds_sport_key: str, api_key: str) -> Dict[str, Any]:
-    url = f"{ODDS_BASE}/sports/{odds_sport_key}/odds"
-    params = {"apiKey": api_key, "regions": "us", "markets": "outrights", "oddsFormat": "american"}
-    data = fetch_json(url, params=params)
-    if not isinstance(data, list): return {"status": "Unavailable"}
+    data = get_odds_payload(odds_sport_key, api_key)
+    if not data: return {"status": "Unavailable"}
 
     target = _normalize_team_name(team_name)
     best_playoff, best_title = None, None
-    for event in data:
-        for book in event.get("bookmakers", []):
-            for market in book.get("markets", []):
-                for outcome in market.get("outcomes", []):
-                    name, desc = _normalize_team_name(outcome.get("name", "")), str(outcome.get("description", "")).lower()
-                    price = outcome.get("price")
-                    if not price: continue
-                    # Fuzzy match: target in name or name in target
-                    if target in name or name in target:
-                        if "playoff" in desc or "make playoffs" in desc:
-                            if best_playoff is None: best_playoff = price
-                        if "champion" in desc or "win" in desc or "title" in desc or market.get("key") == "outrights":
-                            if best_title is None: best_title = price
-    
+    # Flatten the event -> bookmaker -> market -> outcome walk into one generator.
+    flat = (
+        (market.get("key"), outcome)
+        for event in data
+        for book in event.get("bookmakers", [])
+        for market in book.get("markets", [])
+        for outcome in market.get("outcomes", [])
+    )
+    for market_key, outcome in flat:
+        price = outcome.get("price")
+        if not price: continue
+        name = _normalize_team_name(outcome.get("name", ""))
+        # Fuzzy match: target in name or name in target
+        if not (target in name or name in target): continue
+        hay = ((outcome.get("name") or "") + " " + (outcome.get("description") or "")).lower()
+        if best_playoff is None and _PLAYOFF_RE.search(hay):
+            best_playoff = price
+        if best_title is None and (market_key == "outrights" or _TITLE_RE.search(hay)):
+            best_title = price
+        if best_playoff is not None and best_title is not None:
+            break
+
     if best_playoff is None and best_title is None: return {"status": "No market found"}
     res = {"status": "OK"}
     if best_playoff is not None: res["playoff_market"] = f"{best_playoff:+}"
@@ -475,6 +795,7 @@ def get_live_odds_internal(team_name: str, odds_sport_key: str, api_key: str) ->
 def main():
     st.set_page_config(page_title="NeelSPN | Dashboard", page_icon="🏟️", layout="wide")
     inject_custom_css()
+    prefetch_all(TRACKING_CONFIG)
     
     with st.sidebar:
         st.markdown(f'<div style="text-align: center; margin-bottom: 20px;">'
@@ -488,7 +809,7 @@ def main():
         st.caption("• ESPN Core API")
         st.caption("• The Odds API v4")
         
-        api_key = st.secrets.get("ODDS_API_KEY") or os.getenv("ODDS_API_KEY")
+        api_key = _odds_api_key()
         if api_key:
             st.success("📡 Market Data Connected")
         else:
@@ -522,21 +843,29 @@ def main():
             
             st.markdown('</div>', unsafe_allow_html=True)
 
+@st.cache_data(ttl=3600, persist="disk", max_entries=4)
+def fetch_f1_standings() -> Dict[str, Any]:
+    return fetch_json(f"{ESPN_BASE}/racing/f1/standings")
+
+@st.fragment(run_every="180s")
 def render_f1_context():
-    url = f"{ESPN_BASE}/racing/f1/standings"
-    data = fetch_json(url)
+    data = fetch_f1_standings()
     standings = data.get("children", [])
     matched = None
     for group in standings:
         entries = group.get("standings", {}).get("entries", [])
         for e in entries:
             team = e.get("team", {})
-            if "mercedes" in (team.get("displayName", "").lower() + " " + team.get("shortDisplayName", "").lower()):
-                stats = e.get("stats", [])
-                points = next((s.get("displayValue") for s in stats if s.get("name", "").lower() == "points"), "-")
-                rank = next((s.get("displayValue") for s in stats if s.get("name", "").lower() in ["rank", "position"]), "-")
+            # Normalized so "Mercedes-AMG Petronas F1 Team" still matches.
+            team_norm = _normalize_team_name(team.get("displayName", "") + " " + team.get("shortDisplayName", ""))
+            if "mercedes" in team_norm:
+                stat_map = {s.get("name", "").lower(): s.get("displayValue") for s in e.get("stats", [])}
+                points = stat_map.get("points", "-")
+                rank = stat_map.get("rank") or stat_map.get("position") or "-"
                 matched = {"team": team.get("displayName", "Mercedes"), "points": points, "rank": rank}
                 break
+        if matched:
+            break
     if matched:
         st.subheader("Constructor Standings")
         st.markdown('<div class="metric-card">', unsafe_allow_html=True)
@@ -0,0 +1,68 @@
+"""Tiny persistent JSON cache for API responses.
+
+Streamlit's in-process cache is lost on every restart (and on every
+Streamlit Cloud container rotation), which re-hits the APIs and burns
+The Odds API free-tier quota. This layer keeps gzip'd JSON entries under
+`.cache/` keyed by the request URL+params, each with its own TTL, so a
+fresh process can serve warm data without touching the network.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from typing import Any, Optional
+
+CACHE_DIR = ".cache"
+
+
+def _entry_path(key: str) -> str:
+    digest = hashlib.md5(key.encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.json.gz")
+
+
+def get_entry(key: str) -> Optional[dict]:
+    """Return the raw cache entry for `key` (ts/data/etag/last_modified), ignoring TTL."""
+    try:
+        with gzip.open(_entry_path(key), "rt", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def get(key: str, ttl: float) -> Optional[Any]:
+    """Return the cached value for `key`, or None if absent or older than `ttl` seconds."""
+    entry = get_entry(key)
+    if entry is None or time.time() - entry.get("ts", 0) > ttl:
+        return None
+    return entry.get("data")
+
+
+def _write_entry(key: str, entry: dict) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    path = _entry_path(key)
+    tmp_path = f"{path}.tmp.{os.getpid()}"
+    try:
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as fh:
+            json.dump(entry, fh)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Cache is best-effort; a read-only filesystem shouldn't break the app.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def set(key: str, value: Any, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+    """Store `value` for `key`, stamped with the current time and any validator headers."""
+    _write_entry(key, {"ts": time.time(), "data": value, "etag": etag, "last_modified": last_modified})
+
+
+def touch(key: str) -> None:
+    """Re-stamp an existing entry as fresh (e.g. after a 304 Not Modified)."""
+    entry = get_entry(key)
+    if entry is not None:
+        entry["ts"] = time.time()
+        _write_entry(key, entry)